@@ -54,6 +54,7 @@ class DeliveryController(QtWidgets.QWidget):
         self.model = model.DeliveryModel(
             sgtk.platform.current_bundle(), logger
         )
+        self.pending_shots = None
         self.connect_buttons()
         self.load_shots()
 
@@ -68,30 +69,79 @@ class DeliveryController(QtWidgets.QWidget):
     def load_shots(self):
         """Clear the olds shots, then fetches the shots on the model."""
         self.view.final_validation_label.hide()
-
-        for shot in self.view.shot_widget_references:
-            self.view.shot_widget_references[shot]["widget"].hide()
-            self.view.shots_list_widget_layout.removeWidget(
-                self.view.shot_widget_references[shot]["widget"]
-            )
+        self.view.reset_shot_list()
 
         self.view.loading_widget.show()
         self.model.load_shots(
             self.loading_shots_successful,
             self.loading_shots_failed,
+            self.shot_loaded,
         )
 
+    def shot_loaded(self, shot: dict) -> None:
+        """Runs when a single shot has finished loading, so shots show
+        up as their information arrives instead of all at once.
+
+        Args:
+            shot: Shot information dict
+        """
+        if not self.isVisible():
+            return
+
+        shot_widget = self.view.get_shot_widget(shot)
+        self.view.shots_container_layout.addWidget(shot_widget)
+
     def loading_shots_successful(self, shots_to_deliver):
         """Runs when shots have finished loading.
 
+        Populating the shot list while the window is hidden is wasted
+        work, so it gets deferred until the next show event.
+
         Args:
             shots_to_deliver: List of shots to deliver
         """
         self.view.loading_widget.hide()
 
-        for shot in shots_to_deliver:
-            shot_widget = self.view.get_shot_widget(shot)
-            self.view.shots_list_widget_layout.addWidget(shot_widget)
+        if not self.isVisible():
+            self.pending_shots = shots_to_deliver
+            return
+
+        self.populate_shot_list(shots_to_deliver)
+
+    def populate_shot_list(self, shots_to_deliver):
+        """Fills the shot list with a widget per shot.
+
+        Repaints are suspended while adding, so the whole list gets
+        laid out and painted in one pass instead of once per widget.
+        Shots that already streamed in through shot_loaded are skipped.
+
+        Args:
+            shots_to_deliver: List of shots to deliver
+        """
+        self.view.shots_list_widget.setUpdatesEnabled(False)
+        try:
+            for shot in shots_to_deliver:
+                if shot["id"] in self.view.shot_widget_references:
+                    continue
+
+                shot_widget = self.view.get_shot_widget(shot)
+                self.view.shots_container_layout.addWidget(shot_widget)
+        finally:
+            self.view.shots_list_widget.setUpdatesEnabled(True)
+
+    def showEvent(self, event):  # noqa: N802
+        """Populates the shot list with any shots that finished
+        loading while the window was hidden.
+
+        Args:
+            event: Qt show event
+        """
+        super().showEvent(event)
+
+        if self.pending_shots is not None:
+            shots_to_deliver = self.pending_shots
+            self.pending_shots = None
+            self.populate_shot_list(shots_to_deliver)
 
     def loading_shots_failed(self, error: str):
         """Runs when loading shots fails.
@@ -101,7 +151,7 @@ class DeliveryController(QtWidgets.QWidget):
         """
         logger.error(f"Error while loading shots: {error}")
         self.view.loading_widget.hide()
-        self.view.shots_list_widget_layout.addWidget(
+        self.view.shots_container_layout.addWidget(
             QtWidgets.QLabel("Error while loading shots. Please check logs!")
         )
 
@@ -116,6 +166,7 @@ class DeliveryController(QtWidgets.QWidget):
             self.show_validation_error,
             self.update_progress_bar,
             self.show_validation_message,
+            self.show_validation_messages,
         )
 
     def show_validation_error(self, shot: dict) -> None:
@@ -124,12 +175,11 @@ class DeliveryController(QtWidgets.QWidget):
         Args:
             shot: Shot information to show validation error on
         """
-        self.view.shot_widget_references[shot["id"]][
-            "validation_label"
-        ].setText(shot["validation_error"])
-        self.view.shot_widget_references[shot["id"]][
-            "validation_label"
-        ].setStyleSheet("color: '#FF3E3E'; font: bold; font-size: 12px")
+        shot_widget_refs = self.view.shot_widget_references[shot["id"]]
+        shot_widget_refs.validation_label.setText(shot["validation_error"])
+        shot_widget_refs.validation_label.setStyleSheet(
+            "color: '#FF3E3E'; font: bold; font-size: 12px"
+        )
         self.view.final_validation_label.show()
 
     def show_validation_message(self, shot) -> None:
@@ -138,12 +188,27 @@ class DeliveryController(QtWidgets.QWidget):
         Args:
             shot: Shot to show validation message on
         """
-        self.view.shot_widget_references[shot["id"]][
-            "validation_label"
-        ].setText(shot["validation_message"])
-        self.view.shot_widget_references[shot["id"]][
-            "validation_label"
-        ].setStyleSheet("color: '#8BFF3E'; font: normal; font-size: 10px")
+        shot_widget_refs = self.view.shot_widget_references[shot["id"]]
+        shot_widget_refs.validation_label.setText(shot["validation_message"])
+        shot_widget_refs.validation_label.setStyleSheet(
+            "color: '#8BFF3E'; font: normal; font-size: 10px"
+        )
+
+    def show_validation_messages(self, shots: list) -> None:
+        """Sets the validation message on a batch of shot widgets.
+
+        Repaints are suspended while updating so the whole batch
+        paints in one pass.
+
+        Args:
+            shots: Shots to show validation messages on
+        """
+        self.view.shots_list_widget.setUpdatesEnabled(False)
+        try:
+            for shot in shots:
+                self.show_validation_message(shot)
+        finally:
+            self.view.shots_list_widget.setUpdatesEnabled(True)
 
     def update_progress_bar(self, shot: dict) -> None:
         """Updates the progress bar on a shot.
@@ -151,6 +216,5 @@ class DeliveryController(QtWidgets.QWidget):
         Args:
             shot: Shot to change progress bar on
         """
-        self.view.shot_widget_references[shot["id"]][
-            "shot_progress_bar"
-        ].setValue(shot["frames_delivered"])
+        shot_widget_refs = self.view.shot_widget_references[shot["id"]]
+        shot_widget_refs.shot_progress_bar.setValue(shot["frames_delivered"])
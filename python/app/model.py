@@ -25,12 +25,41 @@
 
 from __future__ import annotations
 
+import errno
+import json
 import os
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable
 
 from sgtk.platform.qt5 import QtCore
 
+PUBLISHED_FILE_CACHE_PATH: Path = (
+    Path(tempfile.gettempdir()) / "tk-desktop-deliveries-published-files.json"
+)
+
+# The platform never changes at runtime, so resolve the
+# platform-specific bits once at import time.
+LOCAL_PATH_KEY: str = {
+    "darwin": "local_path_mac",
+    "win32": "local_path_windows",
+}.get(sys.platform, "local_path_linux")
+
+OPEN_FOLDER_COMMAND: list[str] = {
+    "darwin": ["open"],
+    "win32": ["explorer"],
+}.get(sys.platform, ["xdg-open"])
+
+FRAME_PATH_PATTERN = re.compile(r"(.*?)%0?(\d*)d(.*)", re.DOTALL)
+
 
 class ValidationError(Exception):
     """Gets raised when validation fails."""
@@ -49,29 +78,52 @@ class DeliveryModel:
         self.shotgrid_connection = app.shotgun
         self.logger = logger
         self.shots_to_deliver = None
+        self.delivery_folder_path = None
+
+        # Template lookups walk the toolkit configuration, so resolve
+        # the delivery template once instead of per delivered shot.
+        self.delivery_template = app.get_template("delivery_sequence")
 
     def open_delivery_folder(self) -> None:
-        """Finds the correct path and opens the delivery folder."""
-        template = self._app.get_template("delivery_folder")
+        """Finds the correct path and opens the delivery folder.
 
-        roots = self.context.sgtk.roots
-        root_name = self._app.get_setting("default_root")
+        The resolved path is memoized, so repeat clicks skip the
+        template and roots lookups.
+        """
+        if self.delivery_folder_path is None:
+            template = self._app.get_template("delivery_folder")
 
-        project_location = roots.get(root_name)
-        delivery_location = template.apply_fields(project_location)
+            roots = self.context.sgtk.roots
+            root_name = self._app.get_setting("default_root")
 
-        os.startfile(delivery_location)
+            project_location = roots.get(root_name)
+            self.delivery_folder_path = os.path.normpath(
+                template.apply_fields(project_location)
+            )
+
+        # Popen without a shell is fire-and-forget, so the UI doesn't
+        # block while the file manager starts up.
+        try:
+            subprocess.Popen(
+                [*OPEN_FOLDER_COMMAND, self.delivery_folder_path]
+            )
+        except OSError as error:
+            self.logger.error(
+                f"Could not open delivery folder: {error}"
+            )
 
     def load_shots(
         self,
         loading_shots_successful_function: Callable,
         loading_shots_failed_function: Callable,
+        shot_loaded_function: Callable,
     ) -> None:
         """Loads shots on a separate thread.
 
         Args:
             loading_shots_successful_function: Function that gets called when loading shots is successful.
             loading_shots_failed_function: Function that gets called when loading shots failed.
+            shot_loaded_function: Function that gets called with every shot that finished loading.
         """
         self.load_shots_thread = LoadShotsThread(self)
 
@@ -81,12 +133,19 @@ class DeliveryModel:
         self.load_shots_thread.loading_shots_failed.connect(
             loading_shots_failed_function
         )
+        self.load_shots_thread.shot_loaded.connect(shot_loaded_function)
 
         self.load_shots_thread.start()
 
-    def get_shots_to_deliver(self) -> list[dict]:
+    def get_shots_to_deliver(
+        self, shot_loaded_function: Callable | None = None
+    ) -> list[dict]:
         """Gets a list of shots that are ready for delivery.
 
+        Args:
+            shot_loaded_function: Function that gets called with every
+            shot as soon as its information is assembled.
+
         Returns:
             List of shot information dictionaries.
         """
@@ -103,34 +162,50 @@ class DeliveryModel:
             ["sg_status_list", "is", delivery_status],
         ]
 
+        # Dot notation resolves the project code in the same query, so
+        # no separate Project lookup is needed.
         columns = [
             "sg_sequence",
             "code",
+            "project.Project.sg_projectcode",
         ]
 
         shots_to_deliver = self.shotgrid_connection.find(
             "Shot", filters, columns
         )
 
-        self.shots_to_deliver = self.get_shots_information_list(
+        self.shots_to_deliver = []
+        for shot_information in self.get_shots_information_list(
             shots_to_deliver
-        )
+        ):
+            self.shots_to_deliver.append(shot_information)
+            if shot_loaded_function is not None:
+                shot_loaded_function(shot_information)
+
         return self.shots_to_deliver
 
-    def get_latest_shot_version(self, shot_information: dict) -> dict:
-        """Gets the latest version of the shot with some handy information.
+    def get_latest_shot_versions(self, shots_to_deliver: list) -> dict:
+        """Gets the latest version of every shot with some handy information.
+
+        All versions are fetched with a single batched query and reduced
+        to the newest version per shot client-side.
 
         Args:
-            shot_information: Information on shot to get version for
+            shots_to_deliver: List of shots to get versions for
 
         Returns:
-            Latest version of shot
+            Dictionary mapping shot id to latest version of that shot
         """
         filters = [
-            ["entity", "is", {"type": "Shot", "id": shot_information["id"]}],
+            [
+                "entity.Shot.id",
+                "in",
+                [shot["id"] for shot in shots_to_deliver],
+            ],
         ]
 
         columns = [
+            "entity",
             "published_files",
             "sg_first_frame",
             "sg_last_frame",
@@ -143,70 +218,121 @@ class DeliveryModel:
             }
         ]
 
-        return self.shotgrid_connection.find_one(
+        versions = self.shotgrid_connection.find(
             "Version",
             filters,
             columns,
             sorting,
         )
 
-    def get_shot_version_published_file(
-        self, latest_shot_version: dict
+        latest_shot_versions = {}
+        for version in versions:
+            latest_shot_versions.setdefault(version["entity"]["id"], version)
+
+        return latest_shot_versions
+
+    def get_versions_published_files(
+        self, latest_shot_versions: list[dict]
     ) -> dict:
-        """Gets the correct published files associates with this version.
+        """Gets the correct published files associated with these versions.
+
+        All published files are fetched with a single batched query
+        instead of one query per version.
+
+        Published file records never change once created, so results
+        are cached on disk and only ids missing from the cache hit
+        ShotGrid on repeat runs.
 
         Args:
-            latest_shot_version: Latest shot version information
+            latest_shot_versions: List of latest shot version information
 
         Returns:
-            Published files
+            Dictionary mapping published file id to published file
         """
-        publishes = latest_shot_version["published_files"]
+        published_file_ids = [
+            version["published_files"][0]["id"]
+            for version in latest_shot_versions
+        ]
 
-        filters = [
-            ["id", "is", publishes[0]["id"]],
+        cache = self.load_published_file_cache()
+        published_files = {
+            published_file_id: cache[published_file_id]
+            for published_file_id in published_file_ids
+            if published_file_id in cache
+        }
+
+        missing_ids = [
+            published_file_id
+            for published_file_id in published_file_ids
+            if published_file_id not in published_files
         ]
 
-        columns = ["path", "published_file_type", "version_number"]
+        if missing_ids:
+            filters = [
+                ["id", "in", missing_ids],
+            ]
 
-        return self.shotgrid_connection.find_one(
-            "PublishedFile",
-            filters,
-            columns,
-        )
+            columns = ["path", "version_number"]
+
+            for published_file in self.shotgrid_connection.find(
+                "PublishedFile",
+                filters,
+                columns,
+            ):
+                published_files[published_file["id"]] = published_file
+                cache[published_file["id"]] = published_file
+
+            self.save_published_file_cache(cache)
+
+        return published_files
 
-    def get_project_code(self) -> str:
-        """Gets the ShotGrid project code.
+    def load_published_file_cache(self) -> dict:
+        """Loads the on-disk published file cache.
 
         Returns:
-            Project code"""
-        project_id = self.context.project["id"]
-        filters = [
-            [
-                "id",
-                "is",
-                project_id,
-            ]
-        ]
+            Dictionary mapping published file id to published file
+        """
+        try:
+            with PUBLISHED_FILE_CACHE_PATH.open() as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
 
-        columns = ["sg_projectcode"]
-        project = self.shotgrid_connection.find_one(
-            "Project", filters, columns
-        )
+        return {int(key): value for key, value in cache.items()}
 
-        return project["sg_projectcode"]
+    def save_published_file_cache(self, cache: dict) -> None:
+        """Saves the on-disk published file cache.
 
-    def get_shots_information_list(self, shots_to_deliver: list) -> list[dict]:
+        Args:
+            cache: Dictionary mapping published file id to published file
+        """
+        try:
+            with PUBLISHED_FILE_CACHE_PATH.open("w") as cache_file:
+                json.dump(cache, cache_file)
+        except OSError as error:
+            self.logger.debug(
+                f"Could not write published file cache: {error}"
+            )
+
+    def get_shots_information_list(self, shots_to_deliver: list):
         """This function takes a list of shots and adds all the extra
         information we need for the rest of the program to function.
 
         Args:
             shots_to_deliver: List of shots to deliver
 
-        Returns:
-            List of shot information dicts
+        Yields:
+            Shot information dicts
         """
-        shots_information_list = []
+        if not shots_to_deliver:
+            return
+
+        latest_shot_versions = self.get_latest_shot_versions(
+            shots_to_deliver
+        )
+        published_files = self.get_versions_published_files(
+            list(latest_shot_versions.values())
+        )
 
         for shot in shots_to_deliver:
             shot_information = {}
@@ -215,42 +341,43 @@ class DeliveryModel:
             shot_information["shot"] = shot["code"]
             shot_information["id"] = shot["id"]
 
-            latest_shot_version = self.get_latest_shot_version(
-                shot_information
-            )
+            latest_shot_version = latest_shot_versions[shot["id"]]
 
+            # Coerce to int once so every later range() over the frames
+            # can use the values directly.
             shot_information["first_frame"] = (
-                latest_shot_version["sg_first_frame"]
+                int(latest_shot_version["sg_first_frame"])
                 if latest_shot_version["sg_first_frame"]
                 else -1
             )
 
             shot_information["last_frame"] = (
-                latest_shot_version["sg_last_frame"]
+                int(latest_shot_version["sg_last_frame"])
                 if latest_shot_version["sg_last_frame"]
                 else 0
             )
 
-            published_file = self.get_shot_version_published_file(
-                latest_shot_version
-            )
+            published_file = published_files[
+                latest_shot_version["published_files"][0]["id"]
+            ]
             shot_information["sequence_path"] = published_file["path"][
-                "local_path_windows"
+                LOCAL_PATH_KEY
             ]
             shot_information["version_number"] = published_file[
                 "version_number"
             ]
-            shot_information["project_code"] = self.get_project_code()
-
-            shots_information_list.append(shot_information)
+            shot_information["project_code"] = shot[
+                "project.Project.sg_projectcode"
+            ]
 
-        return shots_information_list
+            yield shot_information
 
     def export_shots(
         self,
         show_validation_error: Callable,
         update_progress_bars: Callable,
         show_validation_message: Callable,
+        show_validation_messages: Callable,
     ) -> None:
         """Starts the shot export thread.
 
@@ -258,60 +385,71 @@ class DeliveryModel:
             show_validation_error: Function for showing validation errors
             update_progress_bars: Function for updating progress bars
             show_validation_message: Function for showing validation messages
+            show_validation_messages: Function for showing a batch of
+            validation messages
         """
-        self.validate_shots_thread = ExportShotsThread(
-            self,
-            show_validation_error,
-            update_progress_bars,
-            show_validation_message,
+        self.validate_shots_thread = ExportShotsThread(self)
+
+        self.validate_shots_thread.validation_error.connect(
+            show_validation_error
+        )
+        self.validate_shots_thread.progress_update.connect(
+            update_progress_bars
         )
+        self.validate_shots_thread.validation_message.connect(
+            show_validation_message
+        )
+        self.validate_shots_thread.validation_messages.connect(
+            show_validation_messages
+        )
+
         self.validate_shots_thread.start()
 
-    def validate_all_shots(
+    def validate_shot(
         self,
+        shot: dict,
         show_validation_error: Callable,
         show_validation_message: Callable,
-    ) -> list:
-        """Goes over all the shots and checks if all frames exist.
+    ) -> bool:
+        """Checks if a single shot is ready for delivery.
 
         Args:
+            shot: Shot information dict
             show_validation_error: Function for showing validation errors
             show_validation_message: Function for showing validation messages
 
         Returns:
-            List of successfully validated shots
-
-        Raises:
-            ValidationError: Error when validation fails.
+            True if the shot passed validation
         """
-        self.logger.info("Starting validation of shots.")
+        self.logger.debug(
+            "Validating sequence %s, shot %s.",
+            shot["sequence"],
+            shot["shot"],
+        )
 
-        successfully_validated_shots = []
-        for shot in self.shots_to_deliver:
-            self.logger.info(
-                f"Validating sequence {shot['sequence']}, shot {shot['shot']}."
-            )
-            try:
-                self.validate_filetype(shot)
-                self.validate_all_frames_exist(shot)
-                successfully_validated_shots.append(shot)
-                self.logger.info("Validation passed.")
-                shot["validation_message"] = (
-                    "Initial validation checks passed!"
-                )
-                show_validation_message(shot)
+        try:
+            self.validate_filetype(shot)
+            self.validate_frame_range_data(shot)
+        except ValidationError as error_message:
+            self.logger.error(f"Validation failed: {error_message}")
+            shot["validation_error"] = str(error_message)
 
-            except ValidationError as error_message:
-                self.logger.error(f"Validation failed: {error_message}")
-                shot["validation_error"] = str(error_message)
+            # This is kinda sketchy, I know
+            show_validation_error(shot)
+            return False
 
-                # This is kinda sketchy, I know
-                show_validation_error(shot)
+        self.logger.debug("Validation passed.")
+        shot["validation_message"] = "Initial validation checks passed!"
+        show_validation_message(shot)
+        return True
 
-        return successfully_validated_shots
+    def validate_frame_range_data(self, shot: dict) -> None:
+        """Checks if the version has usable frame range data.
 
-    def validate_all_frames_exist(self, shot: dict) -> None:
-        """Checks if all frames in the shot sequence exist
+        The per-frame existence check happens in the delivery pass
+        itself: a missing source frame fails its hard link, which rolls
+        the delivery back. Checking every frame here as well would walk
+        the whole sequence twice.
 
         Args:
             shot: Shot information dict
@@ -326,23 +464,14 @@ class DeliveryModel:
             error_message = "Shot version is missing frame range data. Was it published correctly?"
             raise ValidationError(error_message)
 
-        for frame in range(shot["first_frame"], shot["last_frame"]):
-
-            try:
-                frame_file_path = Path(shot["sequence_path"] % frame)
-            except TypeError as e:
-                self.logger.error(
-                    "Filepath formatting failed. Probably because linked file on this version is not an EXR sequence."
-                )
-                error_message = "Could not format filepath. Are the EXRs correctly linked to this shot version?"
-                raise ValidationError(error_message) from e
-
-            if not frame_file_path.is_file():
-                self.logger.error(f"Could not find file at {frame_file_path}.")
-                error_message = (
-                    f"Can't find frame {frame}. Does it exist on disk?"
-                )
-                raise ValidationError(error_message)
+        try:
+            Path(shot["sequence_path"] % shot["first_frame"])
+        except TypeError as e:
+            self.logger.error(
+                "Filepath formatting failed. Probably because linked file on this version is not an EXR sequence."
+            )
+            error_message = "Could not format filepath. Are the EXRs correctly linked to this shot version?"
+            raise ValidationError(error_message) from e
 
     def validate_filetype(self, shot: dict) -> None:
         """Checks if the filetype is an EXR.
@@ -368,7 +497,7 @@ class DeliveryModel:
         show_validation_error: Callable,
         show_validation_message: Callable,
         update_progress_bars: Callable,
-    ) -> None:
+    ) -> bool:
         """Copies the shot to the right folder with the right naming conventions.
 
         Args:
@@ -376,10 +505,16 @@ class DeliveryModel:
             show_validation_error: Function for showing validation errors
             show_validation_message: Function for showing validation message,
             update_progress_bars: Function for updating the progress bars
+
+        Returns:
+            True if the shot was delivered successfully
         """
-        try:
-            delivery_template = self._app.get_template("delivery_sequence")
+        # Bound before the try so the FileNotFoundError handler can
+        # read it even when the error fires before any frame is linked,
+        # like when the delivery root itself is missing.
+        futures = []
 
+        try:
             template_fields = {
                 "Projectcode": shot["project_code"],
                 "Sequence": shot["sequence"],
@@ -388,7 +523,7 @@ class DeliveryModel:
             }
 
             delivery_path = Path(
-                delivery_template.apply_fields(template_fields)
+                self.delivery_template.apply_fields(template_fields)
             )
             delivery_folder = delivery_path.parent
 
@@ -398,30 +533,66 @@ class DeliveryModel:
                 )
                 delivery_folder.mkdir(parents=True, exist_ok=True)
 
-            for frame in range(shot["first_frame"], shot["last_frame"] + 1):
-                publish_file = Path(shot["sequence_path"] % frame)
-                delivery_file = delivery_path.with_name(
-                    delivery_path.name % frame
-                )
+            # The parent folders never change per frame, so only the
+            # file names need formatting. Plain strings keep the per
+            # frame work down to a single format call.
+            delivery_folder_prefix = str(delivery_folder) + os.sep
+            format_publish_path = self.compile_frame_path_template(
+                shot["sequence_path"]
+            )
+            format_delivery_name = self.compile_frame_path_template(
+                delivery_path.name
+            )
 
-                os.link(publish_file, delivery_file)
+            frames = range(shot["first_frame"], shot["last_frame"] + 1)
+            publish_files = [format_publish_path(frame) for frame in frames]
+            delivery_files = [
+                delivery_folder_prefix + format_delivery_name(frame)
+                for frame in frames
+            ]
 
-                shot["frames_delivered"] = frame
-                update_progress_bars(shot)
+            # Emitting progress for every frame floods the UI thread
+            # with queued events, so coalesce to about a hundred
+            # updates per shot.
+            total_frames = len(publish_files)
+            progress_interval = max(1, total_frames // 100)
+
+            # os.link releases the GIL around the syscall, so linking
+            # frames on a thread pool overlaps the filesystem latency.
+            max_workers = min(16, (os.cpu_count() or 4) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.link_frame, publish_file, delivery_file
+                    )
+                    for publish_file, delivery_file in zip(
+                        publish_files, delivery_files
+                    )
+                ]
+                for frames_delivered, future in enumerate(
+                    as_completed(futures), start=1
+                ):
+                    future.result()
+
+                    if (
+                        frames_delivered % progress_interval == 0
+                        or frames_delivered == total_frames
+                    ):
+                        shot["frames_delivered"] = (
+                            shot["first_frame"] - 1 + frames_delivered
+                        )
+                        update_progress_bars(shot)
 
             self.logger.info(
-                f"Finished linking {publish_file} to {delivery_file}."
+                f"Finished linking {len(publish_files)} frames to "
+                f"{delivery_path.parent}."
             )
 
-            delivered_status = self._app.get_setting("delivered_status")
-            data = {
-                "sg_status_list": delivered_status,
-            }
-            self.shotgrid_connection.update("Shot", shot["id"], data)
-
             shot["validation_message"] = "Export finished!"
             show_validation_message(shot)
 
+            return True
+
         except FileExistsError:
             self.logger.error(
                 "Files already exist. Has this shot been exported before?"
@@ -431,6 +602,26 @@ class DeliveryModel:
             )
             show_validation_error(shot)
 
+        except FileNotFoundError as error:
+            self.logger.error(
+                f"Could not find file at {error.filename}, "
+                "removing the frames delivered by this run."
+            )
+
+            # Only remove what this run actually created, so frames
+            # from an earlier delivery survive the rollback. All
+            # futures have settled once the executor block exits.
+            linked_delivery_files = [
+                future.result()
+                for future in futures
+                if future.exception() is None
+            ]
+            self.rollback_delivery(linked_delivery_files)
+            shot["validation_error"] = (
+                "A frame is missing on disk. Does the full sequence exist?"
+            )
+            show_validation_error(shot)
+
         except Exception as error:
             self.logger.error(str(error))
             shot["validation_error"] = (
@@ -438,36 +629,224 @@ class DeliveryModel:
             )
             show_validation_error(shot)
 
+        return False
+
+    @staticmethod
+    def compile_frame_path_template(sequence_path: str) -> Callable:
+        """Builds a fast formatting function for a %04d-style frame path.
+
+        The % operator re-parses the format string on every call, so
+        split it once into prefix, padding and suffix, leaving a zfill
+        and a concatenation per frame.
+
+        Args:
+            sequence_path: Path with a printf-style frame placeholder
+
+        Returns:
+            Function that formats a frame number into a path
+        """
+        match = FRAME_PATH_PATTERN.match(sequence_path)
+        if match is None:
+            return lambda frame: sequence_path % frame
+
+        prefix, width, suffix = match.groups()
+        padding = int(width) if width else 0
+
+        def format_frame_path(frame: int) -> str:
+            return f"{prefix}{str(frame).zfill(padding)}{suffix}"
+
+        return format_frame_path
+
+    @staticmethod
+    def link_frame(publish_file: str, delivery_file: str) -> str:
+        """Hard links a frame into the delivery folder.
+
+        Falls back to a regular copy when the delivery folder lives on
+        a different filesystem, where hard links can never succeed.
+        shutil uses the fast copy paths the OS offers, like sendfile
+        and server-side copy offloading.
+
+        Args:
+            publish_file: Path of the published frame
+            delivery_file: Path to deliver the frame to
+
+        Returns:
+            Path of the created delivery frame
+        """
+        try:
+            os.link(publish_file, delivery_file)
+        except OSError as error:
+            if error.errno not in (errno.EXDEV, errno.EPERM):
+                raise
+
+            shutil.copyfile(publish_file, delivery_file)
+
+        return delivery_file
+
+    def mark_shots_delivered(self, delivered_shots: list) -> None:
+        """Sets the delivered status on all delivered shots.
+
+        The status updates share a single batched request instead of
+        one update call per shot.
+
+        Args:
+            delivered_shots: List of delivered shot information dicts
+        """
+        if not delivered_shots:
+            return
+
+        delivered_status = self._app.get_setting("delivered_status")
+
+        batch_data = [
+            {
+                "request_type": "update",
+                "entity_type": "Shot",
+                "entity_id": shot["id"],
+                "data": {"sg_status_list": delivered_status},
+            }
+            for shot in delivered_shots
+        ]
+
+        self.shotgrid_connection.batch(batch_data)
+
+    def rollback_delivery(self, delivery_files: list) -> None:
+        """Removes the delivery files created by this run.
+
+        Cleanup is best effort: deliver_shot must never raise, because
+        the export loop and the batched status update depend on it
+        reporting failure instead.
+
+        Args:
+            delivery_files: List of delivery file paths to remove
+        """
+        for delivery_file in delivery_files:
+            try:
+                os.remove(delivery_file)
+            except OSError as error:
+                self.logger.error(
+                    f"Could not remove {delivery_file} during "
+                    f"rollback: {error}"
+                )
+                continue
+
 
 class ExportShotsThread(QtCore.QThread):
     """Class for exporting shots on a separate thread
-    so the UI doesn't freeze."""
+    so the UI doesn't freeze.
 
-    def __init__(
-        self,
-        model,
-        show_validation_error,
-        update_progress_bars,
-        show_validation_message,
-    ):
+    Validation and delivery run as a producer/consumer pipeline, so
+    delivery of early shots overlaps with validation of later ones.
+    UI updates are emitted as signals so Qt delivers them
+    on the main thread."""
+
+    validation_error = QtCore.Signal(object)
+    validation_message = QtCore.Signal(object)
+    validation_messages = QtCore.Signal(object)
+    progress_update = QtCore.Signal(object)
+
+    def __init__(self, model):
         super().__init__()
         self.model = model
-        self.show_validation_error = show_validation_error
-        self.update_progress_bars = update_progress_bars
-        self.show_validation_message = show_validation_message
+
+    def validate_shots(self, shot_queue):
+        """Validates every shot, feeding the passing ones to the
+        delivery loop.
+
+        Validation messages are coalesced into batches so the UI
+        thread services a handful of queued events instead of one
+        per shot.
+
+        Args:
+            shot_queue: Queue to put validated shots on
+        """
+        self.model.logger.info("Starting validation of shots.")
+
+        pending_messages = []
+        last_flush = time.monotonic()
+
+        def queue_validation_message(shot):
+            nonlocal last_flush
+            pending_messages.append(shot)
+
+            if (
+                len(pending_messages) >= 50
+                or time.monotonic() - last_flush > 0.1
+            ):
+                self.validation_messages.emit(list(pending_messages))
+                pending_messages.clear()
+                last_flush = time.monotonic()
+
+        validated_shot_count = 0
+        try:
+            for shot in self.model.shots_to_deliver:
+                try:
+                    shot_passed = self.model.validate_shot(
+                        shot,
+                        self.validation_error.emit,
+                        queue_validation_message,
+                    )
+                except Exception as error:
+                    self.model.logger.error(
+                        f"Unexpected error while validating shot: {error}"
+                    )
+                    shot["validation_error"] = (
+                        "Unexpected error occurred while validating, please check logs!"
+                    )
+                    self.validation_error.emit(shot)
+                    continue
+
+                if shot_passed:
+                    validated_shot_count += 1
+                    shot_queue.put(shot)
+
+            if pending_messages:
+                self.validation_messages.emit(list(pending_messages))
+        finally:
+            # The delivery loop blocks on the queue until the sentinel
+            # arrives, so it must be put even when validation dies.
+            shot_queue.put(None)
+
+        self.model.logger.info(
+            f"Validation passed on {validated_shot_count} of "
+            f"{len(self.model.shots_to_deliver)} shots."
+        )
 
     def run(self):
-        validated_shots = self.model.validate_all_shots(
-            self.show_validation_error, self.show_validation_message
+        shot_queue = queue.Queue(maxsize=4)
+
+        validation_thread = threading.Thread(
+            target=self.validate_shots, args=(shot_queue,)
         )
+        validation_thread.start()
 
-        for shot in validated_shots:
-            self.model.deliver_shot(
+        delivered_shots = []
+        while True:
+            shot = shot_queue.get()
+            if shot is None:
+                break
+
+            if self.model.deliver_shot(
                 shot,
-                self.show_validation_error,
-                self.show_validation_message,
-                self.update_progress_bars,
+                self.validation_error.emit,
+                self.validation_message.emit,
+                self.progress_update.emit,
+            ):
+                delivered_shots.append(shot)
+
+        validation_thread.join()
+
+        try:
+            self.model.mark_shots_delivered(delivered_shots)
+        except Exception as error:
+            self.model.logger.error(
+                f"Could not update the delivered statuses: {error}"
             )
+            for shot in delivered_shots:
+                shot["validation_error"] = (
+                    "Delivered, but updating the ShotGrid status failed. "
+                    "Please update it manually."
+                )
+                self.validation_error.emit(shot)
 
 
 class LoadShotsThread(QtCore.QThread):
@@ -476,6 +855,7 @@ class LoadShotsThread(QtCore.QThread):
 
     loading_shots_successful = QtCore.Signal(object)
     loading_shots_failed = QtCore.Signal(object)
+    shot_loaded = QtCore.Signal(object)
 
     def __init__(self, model):
         super().__init__()
@@ -483,7 +863,9 @@ class LoadShotsThread(QtCore.QThread):
 
     def run(self):
         try:
-            shots_to_deliver = self.model.get_shots_to_deliver()
+            shots_to_deliver = self.model.get_shots_to_deliver(
+                self.shot_loaded.emit
+            )
             self.loading_shots_successful.emit(shots_to_deliver)
         except Exception as error:
             self.loading_shots_failed.emit(str(error))
@@ -23,6 +23,7 @@
 
 """View for delivery tool, written by Mervin van Brakel 2024"""
 
+from dataclasses import dataclass
 from pathlib import Path
 
 from sgtk.platform.qt5 import QtCore, QtSvg, QtWidgets
@@ -30,6 +31,16 @@ from sgtk.platform.qt5 import QtCore, QtSvg, QtWidgets
 SCRIPT_LOCATION: Path = Path(__file__).parent
 
 
+@dataclass(slots=True)
+class ShotWidgetRefs:
+    """References to the widgets of a single shot row, stored so
+    their UI can be updated later."""
+
+    widget: QtWidgets.QWidget
+    validation_label: QtWidgets.QLabel
+    shot_progress_bar: QtWidgets.QProgressBar
+
+
 class DeliveryView:
     """View for the ShotGrid delivery application.
 
@@ -100,11 +111,31 @@ class DeliveryView:
         self.shots_list_widget.setStyleSheet("background-color:#2A2A2A;")
         self.shots_list_widget_layout.addWidget(self.get_loading_widget())
 
+        self.shots_container = None
+        self.reset_shot_list()
+
         self.shots_list_scroll_area.setWidget(self.shots_list_widget)
         self.shots_list_scroll_area.setWidgetResizable(True)
 
         return self.shots_list_scroll_area
 
+    def reset_shot_list(self) -> None:
+        """Replaces the shot list container with a fresh empty one.
+
+        Dropping the whole container at once is much faster than
+        removing the shot widgets from the layout one by one.
+        """
+        if self.shots_container is not None:
+            self.shots_container.setParent(None)
+            self.shots_container.deleteLater()
+
+        self.shots_container = QtWidgets.QWidget()
+        self.shots_container_layout = QtWidgets.QVBoxLayout(
+            self.shots_container
+        )
+        self.shots_list_widget_layout.addWidget(self.shots_container)
+        self.shot_widget_references = {}
+
     def get_buttons_widget(self) -> QtWidgets.QWidget:
         """Gets the buttons widget of the layout.
 
@@ -170,13 +201,9 @@ class DeliveryView:
         Returns:
             Widget for shot information.
         """
-        self.shot_widget_references[shot["id"]] = {}
-
-        self.shot_widget_references[shot["id"]]["widget"] = QtWidgets.QWidget()
+        shot_widget = QtWidgets.QWidget()
         shot_widget_vertical_layout = QtWidgets.QVBoxLayout()
-        self.shot_widget_references[shot["id"]]["widget"].setLayout(
-            shot_widget_vertical_layout
-        )
+        shot_widget.setLayout(shot_widget_vertical_layout)
 
         shot_name_label = QtWidgets.QLabel(
             f"Sequence {shot['sequence']} - Shot {shot['shot']}."
@@ -190,32 +217,20 @@ class DeliveryView:
         shot_info_label.setStyleSheet("font-size: 12px")
         shot_widget_vertical_layout.addWidget(shot_info_label)
 
-        self.shot_widget_references[shot["id"]]["validation_label"] = (
-            QtWidgets.QLabel("Shot ready for export!")
-        )
-        self.shot_widget_references[shot["id"]][
-            "validation_label"
-        ].setStyleSheet("color: '#8BFF3E'; font-size: 10px;")
-        shot_widget_vertical_layout.addWidget(
-            self.shot_widget_references[shot["id"]]["validation_label"]
-        )
+        validation_label = QtWidgets.QLabel("Shot ready for export!")
+        validation_label.setStyleSheet("color: '#8BFF3E'; font-size: 10px;")
+        shot_widget_vertical_layout.addWidget(validation_label)
 
-        self.shot_widget_references[shot["id"]][
-            "shot_progress_bar"
-        ] = QtWidgets.QProgressBar()
-        self.shot_widget_references[shot["id"]][
-            "shot_progress_bar"
-        ].setMinimum(shot["first_frame"])
-        self.shot_widget_references[shot["id"]][
-            "shot_progress_bar"
-        ].setMaximum(shot["last_frame"])
-        self.shot_widget_references[shot["id"]][
-            "shot_progress_bar"
-        ].setStyleSheet(
+        shot_progress_bar = QtWidgets.QProgressBar()
+        shot_progress_bar.setMinimum(shot["first_frame"])
+        shot_progress_bar.setMaximum(shot["last_frame"])
+        shot_progress_bar.setStyleSheet(
             "QProgressBar::chunk {background-color: #8BFF3E;} QProgressBar {color: black; background-color: #444444; text-align: center;}"
         )
-        shot_widget_vertical_layout.addWidget(
-            self.shot_widget_references[shot["id"]]["shot_progress_bar"]
+        shot_widget_vertical_layout.addWidget(shot_progress_bar)
+
+        self.shot_widget_references[shot["id"]] = ShotWidgetRefs(
+            shot_widget, validation_label, shot_progress_bar
         )
 
-        return self.shot_widget_references[shot["id"]]["widget"]
+        return shot_widget